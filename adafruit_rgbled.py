@@ -20,7 +20,7 @@ Implementation Notes
   https://github.com/adafruit/circuitpython/releases
 """
 try:
-    from typing import Union, Optional, Type
+    from typing import Union, Optional, Tuple, Type
     from types import TracebackType
     from microcontroller import Pin
     from adafruit_pca9685 import PWMChannel
@@ -28,11 +28,55 @@ try:
 except ImportError:
     pass
 
+from array import array
+from time import sleep
+
 from pwmio import PWMOut
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_RGBLED.git"
 
+# Duty-cycle lookup tables, shared by every RGBLED instance. Each 8-bit
+# channel value maps to a 16-bit duty cycle ((x << 8) | x, equal to
+# x * 257, expands 0-255 to 0-65535), with the common-anode inversion baked
+# into the second table so the color setter is a plain subscript with no
+# per-write arithmetic. Because the expansion stays within 16 bits,
+# x ^ 0xFFFF == 65535 - x, the same branchless inversion the packed-int
+# path applies at write time. Packing the entries as uint16 keeps each table at
+# 512 bytes instead of a tuple of 256 boxed ints.
+_LUT = array("H", ((i << 8) | i for i in range(256)))
+_LUT_INV = array("H", (((i << 8) | i) ^ 0xFFFF for i in range(256)))
+
+
+def _promote(pin: Union[Pin, PWMOut, "PWMChannel"]) -> Union[PWMOut, "PWMChannel"]:
+    """Return ``pin`` as a PWM-capable output with its duty cycle zeroed,
+    wrapping raw Pins in a PWMOut."""
+    # Probe the class, not the instance: Blinka Pins are plain Python
+    # objects, so a trial instance write would "succeed" and leave the pin
+    # unpromoted with a dead duty_cycle attribute. PWMOut and PWMChannel
+    # both expose duty_cycle as a property on the class.
+    if not hasattr(type(pin), "duty_cycle"):
+        try:
+            pin = PWMOut(pin)
+        except (TypeError, ValueError):
+            raise TypeError("Pins must be of type Pin, PWMOut or PWMChannel")
+    pin.duty_cycle = 0
+    return pin
+
+
+def _to_rgb(color: ColorBasedColorUnion) -> Tuple[int, int, int]:
+    """Return ``color`` - a 24-bit integer or an (r, g, b) tuple - as three
+    validated 0 - 255 channel values."""
+    try:
+        r, g, b = color.to_bytes(3, "big")
+    except OverflowError:
+        raise ValueError("Only bits 0->23 valid for integer input")
+    except AttributeError:
+        r, g, b = color
+        if (r | g | b) & ~0xFF:
+            raise ValueError("Only a tuple of 3 integers of 0 - 255 for tuple input.")
+    return r, g, b
+
 
 class RGBLED:
     """
@@ -96,6 +140,21 @@ class RGBLED:
         True if the RGB LED is common anode. Defaults to False.
     """
 
+    # Fixed attribute layout - no per-instance __dict__ on CPython, and a
+    # reminder of the full instance state either way.
+    __slots__ = (
+        "_p0",
+        "_p1",
+        "_p2",
+        "_rgb_led_pins",
+        "_invert_pwm",
+        "_inv_mask",
+        "_table",
+        "_last",
+        "_current_color",
+        "_apply",
+    )
+
     def __init__(
         self,
         red_pin: Union[Pin, PWMOut, "PWMChannel"],
@@ -103,18 +162,47 @@ class RGBLED:
         blue_pin: Union[Pin, PWMOut, "PWMChannel"],
         invert_pwm: bool = False,
     ) -> None:
-        self._rgb_led_pins = [red_pin, green_pin, blue_pin]
-        for pin, _ in enumerate(self._rgb_led_pins):
-            try:
-                pin_type = str(type(self._rgb_led_pins[pin]))
-                if pin_type.startswith("<class '") and pin_type.endswith("Pin'>"):
-                    self._rgb_led_pins[pin] = PWMOut(self._rgb_led_pins[pin])
-                self._rgb_led_pins[pin].duty_cycle = 0
-            except AttributeError:
-                raise TypeError("Pins must be of type Pin, PWMOut or PWMChannel")
+        # Dedicated per-pin attributes let the hot paths reach each PWMOut
+        # with a single lookup instead of an attribute load plus subscript;
+        # the tuple is kept for deinit() and introspection.
+        self._p0 = _promote(red_pin)
+        self._p1 = _promote(green_pin)
+        self._p2 = _promote(blue_pin)
+        self._rgb_led_pins = (self._p0, self._p1, self._p2)
         self._invert_pwm = invert_pwm
+        self._inv_mask = 0xFFFF if invert_pwm else 0
+        self._table = _LUT_INV if invert_pwm else _LUT
+        # _promote() already left every duty cycle at 0, which
+        # is "off" for common cathode; common anode needs the inverted level.
+        if invert_pwm:
+            off = self._table[0]
+            self._p0.duty_cycle = off
+            self._p1.duty_cycle = off
+            self._p2.duty_cycle = off
+        # Last 8-bit value written per channel; the hardware now reflects
+        # (0, 0, 0) so seed the skip cache to match.
+        self._last = [0, 0, 0]
         self._current_color = (0, 0, 0)
-        self.color = self._current_color
+        # Specialize the triple write once at construction. The inversion
+        # branch was already partially evaluated away by the table choice
+        # above; capturing the pins, table and skip cache in closure cells
+        # also removes every self.<attr> lookup from the hot path.
+        red, grn, blu = self._rgb_led_pins
+        table = self._table
+        last = self._last
+
+        def _apply(r: int, g: int, b: int) -> None:
+            if r != last[0]:
+                red.duty_cycle = table[r]
+                last[0] = r
+            if g != last[1]:
+                grn.duty_cycle = table[g]
+                last[1] = g
+            if b != last[2]:
+                blu.duty_cycle = table[b]
+                last[2] = b
+
+        self._apply = _apply
 
     def __enter__(self) -> "RGBLED":
         return self
@@ -129,9 +217,18 @@ class RGBLED:
 
     def deinit(self) -> None:
         """Turn the LEDs off, deinit pwmout and release hardware resources."""
-        for pin in self._rgb_led_pins:
-            pin.deinit()  # pylint: disable=no-member
+        # Drive each channel to its off level before releasing it, so the
+        # LED does not stay lit at whatever color was last shown.
+        off = self._table[0]
+        self._p0.duty_cycle = off
+        self._p1.duty_cycle = off
+        self._p2.duty_cycle = off
+        self._p0.deinit()  # pylint: disable=no-member
+        self._p1.deinit()  # pylint: disable=no-member
+        self._p2.deinit()  # pylint: disable=no-member
         self._current_color = (0, 0, 0)
+        # Invalidate in place - the _apply closure captured this list.
+        self._last[:] = (-1, -1, -1)
 
     @property
     def color(self) -> ColorBasedColorUnion:
@@ -152,28 +249,120 @@ class RGBLED:
 
     @color.setter
     def color(self, value: ColorBasedColorUnion):
-        if isinstance(value, int):
-            try:
-                # Check that integer is <= 0xffffff and create an iterable.
-                rgb = value.to_bytes(3, "big", signed=False)
-            except OverflowError:
+        try:
+            # The mask only succeeds for integer input; an (r, g, b)
+            # iterable raises TypeError and falls through to the unpack.
+            # AND with the complement never widens a small int the way a
+            # 24-bit right shift can, and still flags negatives.
+            if value & ~0xFFFFFF:
                 raise ValueError("Only bits 0->23 valid for integer input")
-        elif isinstance(value, tuple):
-            try:
-                rgb = bytes(value)  # Check that tuple has integers of 0 - 255.
-                if len(rgb) != 3:
-                    raise ValueError
-            except (ValueError, TypeError):
+            self._set_packed(value)
+        except TypeError:
+            r, g, b = value
+            # A single OR catches any channel outside 0 - 255 (negative
+            # values set the high bits too) without building a bytes object.
+            if (r | g | b) & ~0xFF:
                 raise ValueError(
                     "Only a tuple of 3 integers of 0 - 255 for tuple input."
                 )
-        else:
-            raise TypeError(
-                "Color must be a tuple of 3 integers or 24-bit integer value."
-            )
-        for color, intensity in enumerate(rgb):
-            # Take advantage of bool truthiness.
-            self._rgb_led_pins[color].duty_cycle = abs(
-                intensity * 257 - 65535 * self._invert_pwm
-            )
+            self._apply(r, g, b)
         self._current_color = value
+
+    @property
+    def frequency(self) -> int:
+        """
+        The PWM frequency of the LED, in Hz. All three channels share the
+        same frequency; reading returns the red channel's value.
+
+        Setting the frequency requires outputs that allow it - PWMOut
+        objects must have been created with ``variable_frequency=True`` and
+        passed in, since pins promoted internally use the fixed default.
+        """
+        return self._p0.frequency
+
+    @frequency.setter
+    def frequency(self, value: int) -> None:
+        self._p0.frequency = value
+        self._p1.frequency = value
+        self._p2.frequency = value
+
+    def set_rgb(self, r: int, g: int, b: int) -> None:
+        """
+        Set the LED color from three 0 - 255 channel values, bypassing the
+        ``color`` property machinery.
+
+        This is the preferred entry point for tight animation loops: it
+        avoids the property descriptor dispatch and the tuple/int detection
+        that ``color`` performs on every assignment.
+
+        :param int r: The red channel value, 0 - 255.
+        :param int g: The green channel value, 0 - 255.
+        :param int b: The blue channel value, 0 - 255.
+        """
+        self._apply(r, g, b)
+        self._current_color = (r, g, b)
+
+    def fade_to(
+        self, color: ColorBasedColorUnion, steps: int = 50, delay: float = 0
+    ) -> None:
+        """
+        Fade smoothly from the current color to ``color``.
+
+        The per-channel ramp is computed once as 16.16 fixed-point integers,
+        so each step costs three adds, clamps and shifts plus the fast
+        triple write - no floats and no per-step tuple allocation.
+
+        :param ColorBasedColorUnion color: The target color - an RGB tuple
+            of values 0 - 255 or a 24-bit integer.
+        :param int steps: The number of intermediate color updates.
+            Defaults to 50.
+        :param float delay: Seconds to sleep between steps. Defaults to 0.
+
+        :raises ValueError: If ``steps`` is less than 1 or ``color`` is out
+          of range.
+        """
+        if steps < 1:
+            raise ValueError("steps must be 1 or greater")
+        target = _to_rgb(color)
+        start = _to_rgb(self._current_color)
+        apply_rgb = self._apply
+        acc_r, acc_g, acc_b = (c << 16 for c in start)
+        step_r, step_g, step_b = (
+            ((t - c) << 16) // steps for t, c in zip(target, start)
+        )
+        for _ in range(steps - 1):
+            acc_r += step_r
+            acc_g += step_g
+            acc_b += step_b
+            # Floor-rounded deltas can drift below zero on a downward ramp
+            # (upward ramps only ever undershoot); clamp so the shift never
+            # produces a negative table index.
+            acc_r = max(acc_r, 0)
+            acc_g = max(acc_g, 0)
+            acc_b = max(acc_b, 0)
+            apply_rgb(acc_r >> 16, acc_g >> 16, acc_b >> 16)
+            if delay:
+                sleep(delay)
+        # Land exactly on the target; the truncated per-step delta can fall
+        # short by a few counts over the ramp.
+        apply_rgb(target[0], target[1], target[2])
+        self._current_color = target
+
+    def _set_packed(self, packed: int) -> None:
+        # Integer fast path: decode the packed color with shifts and masks,
+        # expand 8 to 16 bits with (x << 8) | x and invert branchlessly by
+        # XOR with the precomputed mask.
+        inv = self._inv_mask
+        last = self._last
+        r = (packed >> 16) & 0xFF
+        g = (packed >> 8) & 0xFF
+        b = packed & 0xFF
+        if r != last[0]:
+            self._p0.duty_cycle = ((r << 8) | r) ^ inv
+            last[0] = r
+        if g != last[1]:
+            self._p1.duty_cycle = ((g << 8) | g) ^ inv
+            last[1] = g
+        if b != last[2]:
+            self._p2.duty_cycle = ((b << 8) | b) ^ inv
+            last[2] = b